@@ -24,7 +24,7 @@ import csv
 import json
 import os
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
 
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -175,21 +175,11 @@ class BaseSQLToGCSOperator(BaseOperator):
             self._upload_to_gcs(schema_file)
             schema_file["file_handle"].close()
 
-        counter = 0
         files = []
         total_row_count = 0
         total_files = 0
         self.log.info("Writing local data files")
-        for file_to_upload in self._write_local_data_files(cursor):
-            # Flush file before uploading
-            file_to_upload["file_handle"].flush()
-
-            self.log.info("Uploading chunk file #%d to GCS.", counter)
-            self._upload_to_gcs(file_to_upload)
-
-            self.log.info("Removing local file")
-            file_to_upload["file_handle"].close()
-
+        for file_to_upload in self._upload_data_files(self._write_local_data_files(cursor)):
             # Metadata to be outputted to Xcom
             total_row_count += file_to_upload["file_row_count"]
             total_files += 1
@@ -201,8 +191,6 @@ class BaseSQLToGCSOperator(BaseOperator):
                 }
             )
 
-            counter += 1
-
         file_meta = {
             "bucket": self.bucket,
             "total_row_count": total_row_count,
@@ -212,6 +200,29 @@ class BaseSQLToGCSOperator(BaseOperator):
 
         return file_meta
 
+    def _upload_data_files(self, files_to_upload: Iterable[dict]) -> Iterator[dict]:
+        """
+        Upload the local data files to Google Cloud Storage one after another.
+
+        :param files_to_upload: Local data files, as produced by ``_write_local_data_files``.
+        :return: The uploaded files, in the order in which they were produced.
+        """
+        for counter, file_to_upload in enumerate(files_to_upload):
+            yield self._upload_data_file(file_to_upload, counter)
+
+    def _upload_data_file(self, file_to_upload: dict, counter: int) -> dict:
+        """Upload a single local data file to Google Cloud Storage and remove it."""
+        try:
+            # Flush file before uploading
+            file_to_upload["file_handle"].flush()
+
+            self.log.info("Uploading chunk file #%d to GCS.", counter)
+            self._upload_to_gcs(file_to_upload)
+        finally:
+            self.log.info("Removing local file")
+            file_to_upload["file_handle"].close()
+        return file_to_upload
+
     def convert_types(self, schema, col_type_dict, row) -> list:
         """Convert values from DBAPI to output-friendly formats."""
         return [
@@ -253,7 +264,9 @@ class BaseSQLToGCSOperator(BaseOperator):
 
         prev_partition_values = None
         curr_partition_values = None
-        for row in cursor:
+        # Cursors may provide a streaming ``iter_rows`` that fetches rows in batches.
+        rows = cursor.iter_rows() if hasattr(cursor, "iter_rows") else cursor
+        for row in rows:
             if self.partition_columns:
                 row_dict = dict(zip(schema, row))
                 curr_partition_values = tuple(
@@ -17,14 +17,28 @@
 # under the License.
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any
 
 from airflow.providers.google.cloud.transfers.sql_to_gcs import BaseSQLToGCSOperator
 from airflow.providers.trino.hooks.trino import TrinoHook
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
     from trino.client import TrinoResult
-    from trino.dbapi import Cursor as TrinoCursor
+    from trino.dbapi import Connection as TrinoConnection, Cursor as TrinoCursor
+
+
+@lru_cache(maxsize=256)
+def _trino_base_type(field_type: str) -> str:
+    """Normalize a Trino type name, e.g. ``decimal(2, 10)`` => ``DECIMAL``."""
+    paren = field_type.find("(")
+    base_type = field_type[:paren] if paren != -1 else field_type
+    return base_type.upper()
 
 
 class _TrinoToGCSTrinoCursorAdapter:
@@ -35,16 +49,19 @@ class _TrinoToGCSTrinoCursorAdapter:
     The following changes have been made:
 
     * The poke mechanism for row. You can look at the next row without consuming it.
-    * The description attribute is available before reading the first row. Thanks to the poke mechanism.
+    * The description attribute is available before reading the first row. If the cursor does not
+      provide it yet, it is loaded thanks to the poke mechanism.
     * the iterator interface has been implemented.
 
     A detailed description of the class methods is available in
     `PEP-249 <https://www.python.org/dev/peps/pep-0249/>`__.
     """
 
+    __slots__ = ("cursor", "rows", "initialized")
+
     def __init__(self, cursor: TrinoCursor):
         self.cursor: TrinoCursor = cursor
-        self.rows: list[Any] = []
+        self.rows: deque[Any] = deque()
         self.initialized: bool = False
 
     @property
@@ -65,6 +82,8 @@ class _TrinoToGCSTrinoCursorAdapter:
         The first two items (``name`` and ``type_code``) are mandatory, the other
         five are optional and are set to None if no meaningful values can be provided.
         """
+        if self.cursor.description is not None:
+            return self.cursor.description
         if not self.initialized:
             # Peek for first row to load description.
             self.peekone()
@@ -81,8 +100,8 @@ class _TrinoToGCSTrinoCursorAdapter:
 
     def execute(self, *args, **kwargs) -> TrinoResult:
         """Prepare and execute a database operation (query or command)."""
+        self.rows.clear()
         self.initialized = False
-        self.rows = []
         return self.cursor.execute(*args, **kwargs)
 
     def executemany(self, *args, **kwargs):
@@ -92,21 +111,25 @@ class _TrinoToGCSTrinoCursorAdapter:
         Prepare a database operation (query or command) and then execute it against
         all parameter sequences or mappings found in the sequence seq_of_parameters.
         """
+        self.rows.clear()
         self.initialized = False
-        self.rows = []
         return self.cursor.executemany(*args, **kwargs)
 
     def peekone(self) -> Any:
         """Return the next row without consuming it."""
+        if self.rows:
+            return self.rows[0]
         self.initialized = True
         element = self.cursor.fetchone()
-        self.rows.insert(0, element)
+        # Only real rows are buffered, so the buffer never holds the end-of-results ``None``.
+        if element is not None:
+            self.rows.appendleft(element)
         return element
 
     def fetchone(self) -> Any:
         """Fetch the next row of a query result set, returning a single sequence, or ``None``."""
         if self.rows:
-            return self.rows.pop(0)
+            return self.rows.popleft()
         return self.cursor.fetchone()
 
     def fetchmany(self, size=None) -> list:
@@ -119,14 +142,28 @@ class _TrinoToGCSTrinoCursorAdapter:
             size = self.cursor.arraysize
 
         result = []
-        for _ in range(size):
-            row = self.fetchone()
-            if row is None:
-                break
-            result.append(row)
+        while self.rows and len(result) < size:
+            result.append(self.rows.popleft())
+
+        remaining = size - len(result)
+        if remaining > 0:
+            chunk = self.cursor.fetchmany(remaining)
+            if chunk:
+                result.extend(chunk)
 
         return result
 
+    def iter_rows(self) -> Iterator[Any]:
+        """
+        Yield the remaining rows one at a time.
+
+        Once the peeked row is consumed, rows are read directly from the underlying cursor,
+        which saves the adapter ``fetchone`` call per row. It does not reduce round trips to Trino.
+        """
+        while self.rows:
+            yield self.rows.popleft()
+        yield from iter(self.cursor.fetchone, None)
+
     def __next__(self) -> Any:
         """
         Return the next row from the current SQL statement using the same semantics as ``.fetchone()``.
@@ -147,6 +184,13 @@ class TrinoToGCSOperator(BaseSQLToGCSOperator):
     """Copy data from TrinoDB to Google Cloud Storage in JSON, CSV or Parquet format.
 
     :param trino_conn_id: Reference to a specific Trino hook.
+    :param fetch_size: The ``arraysize`` of the Trino cursor, i.e. the number of rows returned
+        by ``fetchmany()`` when no size is given.
+    :param max_pending_uploads: The maximum number of finished data files uploaded to
+        Google Cloud Storage in the background while rows are still being fetched from Trino.
+        Up to ``max_pending_uploads + 1`` data files, each of up to ``approx_max_file_size_bytes``,
+        may then be kept on local disk at the same time. By default (``0``) each file is uploaded
+        before the next rows are fetched.
     """
 
     ui_color = "#a0e08c"
@@ -176,26 +220,78 @@ class TrinoToGCSOperator(BaseSQLToGCSOperator):
         "UUID": "STRING",
     }
 
-    def __init__(self, *, trino_conn_id: str = "trino_default", **kwargs):
+    def __init__(
+        self,
+        *,
+        trino_conn_id: str = "trino_default",
+        fetch_size: int = 10000,
+        max_pending_uploads: int = 0,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
+        if fetch_size < 1:
+            raise ValueError(f"fetch_size must be a positive integer, got {fetch_size}.")
         self.trino_conn_id = trino_conn_id
+        self.fetch_size = fetch_size
+        self.max_pending_uploads = max_pending_uploads
+
+    @cached_property
+    def db_hook(self) -> TrinoHook:
+        """Trino hook used by the operator."""
+        return TrinoHook(trino_conn_id=self.trino_conn_id)
+
+    @cached_property
+    def conn(self) -> TrinoConnection:
+        """Trino connection shared by all queries run by the operator."""
+        return self.db_hook.get_conn()
+
+    def post_execute(self, context: Any, result: Any = None):
+        super().post_execute(context, result)
+        self._close_conn()
+
+    def on_kill(self) -> None:
+        self._close_conn()
+
+    def _close_conn(self) -> None:
+        """Close the cached Trino connection, so the next execution opens a new one."""
+        conn = self.__dict__.pop("conn", None)
+        if conn is not None:
+            conn.close()
 
     def query(self):
         """Query trino and returns a cursor to the results."""
-        trino = TrinoHook(trino_conn_id=self.trino_conn_id)
-        conn = trino.get_conn()
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
+        cursor.arraysize = self.fetch_size
         self.log.info("Executing: %s", self.sql)
         cursor.execute(self.sql)
         return _TrinoToGCSTrinoCursorAdapter(cursor)
 
+    def _upload_data_files(self, files_to_upload: Iterable[dict]) -> Iterator[dict]:
+        """Upload finished data files in a background thread while the next file is being written."""
+        if self.max_pending_uploads <= 0:
+            yield from super()._upload_data_files(files_to_upload)
+            return
+
+        pending: deque[tuple[Future, dict]] = deque()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            for counter, file_to_upload in enumerate(files_to_upload):
+                future = executor.submit(self._upload_data_file, file_to_upload, counter)
+                pending.append((future, file_to_upload))
+                # Uploads complete in order, so a failure surfaces before more rows are fetched.
+                while pending and (len(pending) > self.max_pending_uploads or pending[0][0].done()):
+                    yield pending.popleft()[0].result()
+            while pending:
+                yield pending.popleft()[0].result()
+        finally:
+            for future, file_to_upload in pending:
+                if future.cancel():
+                    file_to_upload["file_handle"].close()
+            executor.shutdown(wait=True)
+
     def field_to_bigquery(self, field) -> dict[str, str]:
         """Convert trino field type to BigQuery field type."""
-        clear_field_type = field[1].upper()
-        # remove type argument e.g. DECIMAL(2, 10) => DECIMAL
-        clear_field_type, _, _ = clear_field_type.partition("(")
-        new_field_type = self.type_map.get(clear_field_type, "STRING")
-
+        new_field_type = self.type_map.get(_trino_base_type(field[1]), "STRING")
         return {"name": field[0], "type": new_field_type}
 
     def convert_type(self, value, schema_type, **kwargs):